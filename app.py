@@ -1,14 +1,183 @@
 """Streamlit Web Interface for the Docstring Generator tool."""
+import hashlib
 import streamlit as st
-import os
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from main import run, load_config
+from main import run, load_config, _decode_source
 
 # Load config for initial state
 config = load_config()
 
+
+@st.cache_data(show_spinner=False)
+def cached_run(source_bytes: bytes, style: str, validate: bool):
+    """Runs the analysis once per unique (source, style, validate) combination."""
+    return run(source=source_bytes, style=style, validate=validate)
+
+
+# st.fragment graduated from st.experimental_fragment in Streamlit 1.37
+fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
+
+@fragment
+def render_coverage(report):
+    """Renders the coverage tab; interactions here rerun only this fragment."""
+    # Deferred so the upload page loads without pulling in plotly
+    import plotly.graph_objects as go
+
+    st.subheader("Documentation Coverage Audit")
+    
+    # Key Metrics
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Overall Coverage", f"{report['coverage_percentage']:.1f}%")
+    m2.metric("Total Entities", report['total'])
+    m3.metric("Documented", report['with_doc'])
+    m4.metric("Missing", report['missing'])
+
+    col_chart, col_details = st.columns([2, 1])
+    
+    with col_chart:
+        # Pie Chart for Coverage
+        labels = ['Documented', 'Missing']
+        values = [report['with_doc'], report['missing']]
+        
+        # Reuse the figure across reruns and only swap in new values
+        fig = st.session_state.get("coverage_pie_fig")
+        if fig is None:
+            fig = go.Figure(data=[go.Pie(
+                labels=labels, 
+                values=values, 
+                hole=.6,
+                marker=dict(colors=['#00d2ff', '#e94560']),
+                textinfo='percent+label'
+            )])
+            fig.update_layout(
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(color="white"),
+                margin=dict(t=0, b=0, l=0, r=0),
+                showlegend=False
+            )
+            st.session_state["coverage_pie_fig"] = fig
+        else:
+            fig.data[0].values = values
+        st.plotly_chart(fig, use_container_width=True, key="coverage_pie")
+
+    with col_details:
+        st.write("#### 📌 Breakdown")
+        st.write(f"**Functions:** {report['documented_functions']} / {report['total_functions']}")
+        st.progress(report['documented_functions'] / report['total_functions'] if report['total_functions'] > 0 else 1.0)
+        
+        st.write(f"**Classes:** {report['documented_classes']} / {report['total_classes']}")
+        st.progress(report['documented_classes'] / report['total_classes'] if report['total_classes'] > 0 else 1.0)
+
+        mod_status = "✅ Present" if report.get("has_module_doc") else "❌ Missing"
+        st.write(f"**Module Docstring:** {mod_status}")
+
+
+@fragment
+def render_compliance(report, validate):
+    """Renders the compliance tab; interactions here rerun only this fragment."""
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    st.subheader("PEP 257 Compliance Report")
+    
+    if not validate:
+        st.warning("⚠️ Compliance checks were disabled for this run.")
+    else:
+        comp_status = report['compliance']
+        comp_percentage = report.get('compliance_percentage', 100.0)
+        color = "#00ff88" if comp_status == "PASS" else "#ff4444"
+        
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.metric("Compliance Score", f"{comp_percentage:.1f}%")
+            st.metric("Total Violations", len(report['violations']), delta=len(report['violations']), delta_color="inverse")
+            
+            if comp_status == "PASS":
+                st.success("✅ **STATUS: PASS**")
+            else:
+                st.error("❌ **STATUS: FAIL**")
+        
+        with col2:
+            # Simple Compliance Gauge/Progress
+            fig_comp = st.session_state.get("compliance_gauge_fig")
+            if fig_comp is None:
+                fig_comp = go.Figure(go.Indicator(
+                    mode = "gauge+number",
+                    value = comp_percentage,
+                    domain = {'x': [0, 1], 'y': [0, 1]},
+                    title = {'text': "Compliance Detail"},
+                    gauge = {
+                        'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "white"},
+                        'bar': {'color': color},
+                        'bgcolor': "rgba(0,0,0,0)",
+                        'borderwidth': 2,
+                        'bordercolor': "white",
+                        'steps': [
+                            {'range': [0, 70], 'color': 'rgba(255, 68, 68, 0.1)'},
+                            {'range': [70, 90], 'color': 'rgba(255, 187, 51, 0.1)'},
+                            {'range': [90, 100], 'color': 'rgba(0, 255, 136, 0.1)'}
+                        ],
+                    }
+                ))
+                fig_comp.update_layout(
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color="white"),
+                    margin=dict(t=30, b=0, l=30, r=30),
+                    height=250
+                )
+                st.session_state["compliance_gauge_fig"] = fig_comp
+            else:
+                fig_comp.data[0].value = comp_percentage
+                fig_comp.data[0].gauge.bar.color = color
+            st.plotly_chart(fig_comp, use_container_width=True, key="compliance_gauge")
+
+        if report.get('validation_error'):
+            st.error(f"Validation could not run: {report['validation_error']}")
+        elif not report['violations']:
+            st.balloons()
+            st.success("🌟 Perfect Compliance! This codebase adheres to PEP 257 standards.")
+        else:
+            # Bar Chart for Violations by Code
+            violation_codes = [v['code'] for v in report['violations']]
+            code_counts = pd.Series(violation_codes).value_counts().reset_index()
+            code_counts.columns = ['Code', 'Count']
+            
+            fig_violations = st.session_state.get("violations_bar_fig")
+            if fig_violations is None:
+                fig_violations = px.bar(
+                    code_counts, 
+                    x='Code', 
+                    y='Count',
+                    title="Violation Frequency by Code",
+                    color='Count',
+                    color_continuous_scale='Reds'
+                )
+                # Skip per-bar outline strokes; they add SVG work without visual value here
+                fig_violations.update_traces(marker_line_width=0)
+                fig_violations.update_layout(
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color="white"),
+                )
+                st.session_state["violations_bar_fig"] = fig_violations
+            else:
+                bar = fig_violations.data[0]
+                bar.x = code_counts['Code']
+                bar.y = code_counts['Count']
+                bar.marker.color = code_counts['Count']
+            st.plotly_chart(fig_violations, use_container_width=True, key="violations_bar")
+
+            st.markdown("#### 🚩 Identified Violations")
+            for v in report['violations']:
+                with st.container():
+                    st.error(f"**[{v['code']}]** Line {v['line']}: {v['message']}")
+                    st.write(f"_{v['short_desc']}_")
+                    st.divider()
+
+
 # Page Configuration
 st.set_page_config(
     page_title="Docstring Intelligence Pro",
@@ -94,15 +263,19 @@ with st.sidebar:
 uploaded_file = st.file_uploader("📂 Select Python Source File", type=["py"])
 
 if uploaded_file is not None:
-    source_code = uploaded_file.read().decode("utf-8")
-    
-    # Save to a temporary file
-    temp_filename = "temp_upload.py"
-    with open(temp_filename, "w", encoding="utf-8") as f:
-        f.write(source_code)
+    source_bytes = uploaded_file.getvalue()
+    # Decoded (PEP 263 cookie or BOM aware) only for display; run() takes the bytes
+    source_code = _decode_source(source_bytes)
+
+    upload_key = (hashlib.blake2b(source_bytes).hexdigest(), style, validate)
 
     if st.button("🔥 Run Analysis & Generation"):
-        docs, report = run(temp_filename, style=style, validate=validate)
+        st.session_state["analysis"] = (upload_key, *cached_run(source_bytes, style, validate))
+
+    # Results persist across reruns until the file or settings change
+    analysis = st.session_state.get("analysis")
+    if analysis is not None and analysis[0] == upload_key:
+        _, docs, report = analysis
 
         # Create Tabs for Separated Reports
         tab_code, tab_coverage, tab_compliance = st.tabs([
@@ -127,132 +300,7 @@ if uploaded_file is not None:
                             st.code(d['docstring'], language="python")
 
         with tab_coverage:
-            st.subheader("Documentation Coverage Audit")
-            
-            # Key Metrics
-            m1, m2, m3, m4 = st.columns(4)
-            m1.metric("Overall Coverage", f"{report['coverage_percentage']:.1f}%")
-            m2.metric("Total Entities", report['total'])
-            m3.metric("Documented", report['with_doc'])
-            m4.metric("Missing", report['missing'])
-
-            col_chart, col_details = st.columns([2, 1])
-            
-            with col_chart:
-                # Pie Chart for Coverage
-                labels = ['Documented', 'Missing']
-                values = [report['with_doc'], report['missing']]
-                
-                fig = go.Figure(data=[go.Pie(
-                    labels=labels, 
-                    values=values, 
-                    hole=.6,
-                    marker=dict(colors=['#00d2ff', '#e94560']),
-                    textinfo='percent+label'
-                )])
-                fig.update_layout(
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color="white"),
-                    margin=dict(t=0, b=0, l=0, r=0),
-                    showlegend=False
-                )
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col_details:
-                st.write("#### 📌 Breakdown")
-                st.write(f"**Functions:** {report['documented_functions']} / {report['total_functions']}")
-                st.progress(report['documented_functions'] / report['total_functions'] if report['total_functions'] > 0 else 1.0)
-                
-                st.write(f"**Classes:** {report['documented_classes']} / {report['total_classes']}")
-                st.progress(report['documented_classes'] / report['total_classes'] if report['total_classes'] > 0 else 1.0)
-
-                mod_status = "✅ Present" if report.get("has_module_doc") else "❌ Missing"
-                st.write(f"**Module Docstring:** {mod_status}")
+            render_coverage(report)
 
         with tab_compliance:
-            st.subheader("PEP 257 Compliance Report")
-            
-            if not validate:
-                st.warning("⚠️ Compliance checks were disabled for this run.")
-            else:
-                comp_status = report['compliance']
-                comp_percentage = report.get('compliance_percentage', 100.0)
-                color = "#00ff88" if comp_status == "PASS" else "#ff4444"
-                
-                col1, col2 = st.columns([1, 2])
-                with col1:
-                    st.metric("Compliance Score", f"{comp_percentage:.1f}%")
-                    st.metric("Total Violations", len(report['violations']), delta=len(report['violations']), delta_color="inverse")
-                    
-                    if comp_status == "PASS":
-                        st.success("✅ **STATUS: PASS**")
-                    else:
-                        st.error("❌ **STATUS: FAIL**")
-                
-                with col2:
-                    # Simple Compliance Gauge/Progress
-                    fig_comp = go.Figure(go.Indicator(
-                        mode = "gauge+number",
-                        value = comp_percentage,
-                        domain = {'x': [0, 1], 'y': [0, 1]},
-                        title = {'text': "Compliance Detail"},
-                        gauge = {
-                            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "white"},
-                            'bar': {'color': color},
-                            'bgcolor': "rgba(0,0,0,0)",
-                            'borderwidth': 2,
-                            'bordercolor': "white",
-                            'steps': [
-                                {'range': [0, 70], 'color': 'rgba(255, 68, 68, 0.1)'},
-                                {'range': [70, 90], 'color': 'rgba(255, 187, 51, 0.1)'},
-                                {'range': [90, 100], 'color': 'rgba(0, 255, 136, 0.1)'}
-                            ],
-                        }
-                    ))
-                    fig_comp.update_layout(
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        font=dict(color="white"),
-                        margin=dict(t=30, b=0, l=30, r=30),
-                        height=250
-                    )
-                    st.plotly_chart(fig_comp, use_container_width=True)
-
-                if not report['violations']:
-                    st.balloons()
-                    st.success("🌟 Perfect Compliance! This codebase adheres to PEP 257 standards.")
-                else:
-                    # Bar Chart for Violations by Code
-                    violation_codes = [v['code'] for v in report['violations']]
-                    code_counts = pd.Series(violation_codes).value_counts().reset_index()
-                    code_counts.columns = ['Code', 'Count']
-                    
-                    fig_violations = px.bar(
-                        code_counts, 
-                        x='Code', 
-                        y='Count',
-                        title="Violation Frequency by Code",
-                        color='Count',
-                        color_continuous_scale='Reds'
-                    )
-                    fig_violations.update_layout(
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        font=dict(color="white"),
-                    )
-                    st.plotly_chart(fig_violations, use_container_width=True)
-
-                    st.markdown("#### 🚩 Identified Violations")
-                    for v in report['violations']:
-                        with st.container():
-                            st.error(f"**[{v['code']}]** Line {v['line']}: {v['message']}")
-                            st.write(f"_{v['short_desc']}_")
-                            st.divider()
-
-    # Cleanup
-    if os.path.exists("temp_upload.py"):
-        try:
-            pass # Keep it for debugging or let streamlit handle session state
-        except:
-            pass
+            render_compliance(report, validate)
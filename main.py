@@ -6,12 +6,38 @@ compliance with PEP-257 using pydocstyle.
 """
 import ast
 import argparse
+import bisect
+import functools
+import hashlib
 import sys
+import threading
 import io
+import tokenize
 import tomllib
 import os
-from pydocstyle import check
-from pydocstyle.violations import conventions
+from concurrent.futures import ProcessPoolExecutor
+
+# Docstring templates, built once and filled with str.format per entity
+_FUNC_SUMMARY = '"""{name} function.\n\n'
+_CLASS_SUMMARY = '"""{name} class.\n\n'
+_DOC_END = '"""'
+
+_GOOGLE_ARG_LINE = "    {name}{type_hint}: Description for {name}.\n"
+_GOOGLE_RETURNS_LINE = "    {type_hint}Description of the return value.\n"
+_GOOGLE_RAISES_LINE = "    {name}: Description for {name}.\n"
+_GOOGLE_ATTR_LINE = "    {name}: Description.\n"
+
+_NUMPY_PARAM_LINE = "{name}{type_hint}\n    Description for {name}.\n"
+_NUMPY_RETURNS_LINE = "{type_hint}    Description of the return value.\n"
+_NUMPY_RAISES_LINE = "{name}\n    Description for {name}.\n"
+_NUMPY_ATTR_LINE = "{name}\n    Description.\n"
+
+_REST_PARAM_LINE = ":param {name}: Description for {name}.\n"
+_REST_TYPE_LINE = ":type {name}: {type_hint}\n"
+_REST_RTYPE_LINE = ":rtype: {type_hint}\n"
+_REST_RAISES_LINE = ":raises {name}: Description for {name}.\n"
+_REST_ATTR_LINE = ":ivar {name}: Description.\n"
+
 
 class DocstringGenerator:
     """Generates docstrings in various styles: Google, NumPy, reST."""
@@ -19,203 +45,359 @@ class DocstringGenerator:
     def __init__(self, style="google"):
         """Initializes the generator with a specific style."""
         self.style = style.lower()
+        # Resolve the per-style function generator once instead of per call
+        self._func_gen = {
+            "google": self._generate_google_func,
+            "numpy": self._generate_numpy_func,
+            "rest": self._generate_rest_func,
+        }.get(self.style)
+        # Class attribute section header and line template (reST has no header)
+        self._attr_header, self._attr_line = {
+            "google": ("Attributes:\n", _GOOGLE_ATTR_LINE),
+            "numpy": ("Attributes\n----------\n", _NUMPY_ATTR_LINE),
+        }.get(self.style, ("", _REST_ATTR_LINE))
 
     def generate(self, info):
         """Generates a docstring for a given function or class metadata."""
         if info["type"] == "function":
-            if self.style == "google":
-                return self._generate_google_func(info)
-            elif self.style == "numpy":
-                return self._generate_numpy_func(info)
-            elif self.style == "rest":
-                return self._generate_rest_func(info)
+            return self._func_gen(info) if self._func_gen else ""
         elif info["type"] == "class":
             return self._generate_class_doc(info)
         return ""
 
     def _generate_google_func(self, info):
         """Generates a Google-style docstring for a function."""
-        doc = f'"""{info["name"]} function.\n\n'
+        parts = [_FUNC_SUMMARY.format(name=info["name"])]
         if info["params"]:
-            doc += "Args:\n"
-            for p, t in info["params"]:
-                type_hint = f" ({t})" if t else ""
-                doc += f"    {p}{type_hint}: Description for {p}.\n"
+            parts.append("Args:\n")
+            parts.extend(
+                _GOOGLE_ARG_LINE.format(name=p, type_hint=f" ({t})" if t else "")
+                for p, t in info["params"]
+            )
         
         if info["yields"]:
-            doc += "\nYields:\n"
-            doc += "    Description of the yielded values.\n"
+            parts.append("\nYields:\n")
+            parts.append("    Description of the yielded values.\n")
         elif info["returns"]:
-            doc += "\nReturns:\n"
+            parts.append("\nReturns:\n")
             type_hint = f"{info['return_type']}: " if info['return_type'] else ""
-            doc += f"    {type_hint}Description of the return value.\n"
+            parts.append(_GOOGLE_RETURNS_LINE.format(type_hint=type_hint))
 
         if info["raises"]:
-            doc += "\nRaises:\n"
-            for r in sorted(list(info["raises"])):
-                doc += f"    {r}: Description for {r}.\n"
+            parts.append("\nRaises:\n")
+            parts.extend(_GOOGLE_RAISES_LINE.format(name=r) for r in info["raises"])
         
-        doc += '"""'
-        return doc
+        parts.append(_DOC_END)
+        return "".join(parts)
 
     def _generate_numpy_func(self, info):
         """Generates a NumPy-style docstring for a function."""
-        doc = f'"""{info["name"]} function.\n\n'
+        parts = [_FUNC_SUMMARY.format(name=info["name"])]
         if info["params"]:
-            doc += "Parameters\n----------\n"
-            for p, t in info["params"]:
-                type_hint = f" : {t}" if t else ""
-                doc += f"{p}{type_hint}\n    Description for {p}.\n"
+            parts.append("Parameters\n----------\n")
+            parts.extend(
+                _NUMPY_PARAM_LINE.format(name=p, type_hint=f" : {t}" if t else "")
+                for p, t in info["params"]
+            )
         
         if info["yields"]:
-            doc += "\nYields\n------\n"
-            doc += "Description of the yielded values.\n"
+            parts.append("\nYields\n------\n")
+            parts.append("Description of the yielded values.\n")
         elif info["returns"]:
-            doc += "\nReturns\n-------\n"
+            parts.append("\nReturns\n-------\n")
             type_hint = f"{info['return_type']}\n" if info['return_type'] else ""
-            doc += f"{type_hint}    Description of the return value.\n"
+            parts.append(_NUMPY_RETURNS_LINE.format(type_hint=type_hint))
 
         if info["raises"]:
-            doc += "\nRaises\n------\n"
-            for r in sorted(list(info["raises"])):
-                doc += f"{r}\n    Description for {r}.\n"
+            parts.append("\nRaises\n------\n")
+            parts.extend(_NUMPY_RAISES_LINE.format(name=r) for r in info["raises"])
         
-        doc += '"""'
-        return doc
+        parts.append(_DOC_END)
+        return "".join(parts)
 
     def _generate_rest_func(self, info):
         """Generates a reST-style docstring for a function."""
-        doc = f'"""{info["name"]} function.\n\n'
+        parts = [_FUNC_SUMMARY.format(name=info["name"])]
         for p, t in info["params"]:
-            doc += f":param {p}: Description for {p}.\n"
+            parts.append(_REST_PARAM_LINE.format(name=p))
             if t:
-                doc += f":type {p}: {t}\n"
+                parts.append(_REST_TYPE_LINE.format(name=p, type_hint=t))
         
         if info["yields"]:
-            doc += "\n:yields: Description of the yielded values.\n"
+            parts.append("\n:yields: Description of the yielded values.\n")
         elif info["returns"]:
-            doc += f"\n:returns: Description of the return value.\n"
+            parts.append("\n:returns: Description of the return value.\n")
             if info['return_type']:
-                doc += f":rtype: {info['return_type']}\n"
+                parts.append(_REST_RTYPE_LINE.format(type_hint=info['return_type']))
 
         if info["raises"]:
-            for r in sorted(list(info["raises"])):
-                doc += f":raises {r}: Description for {r}.\n"
+            parts.extend(_REST_RAISES_LINE.format(name=r) for r in info["raises"])
         
-        doc += '"""'
-        return doc
+        parts.append(_DOC_END)
+        return "".join(parts)
 
     def _generate_class_doc(self, info):
         """Generates a docstring for a class."""
-        doc = f'"""{info["name"]} class.\n\n'
+        parts = [_CLASS_SUMMARY.format(name=info["name"])]
         if info["attributes"]:
-            if self.style == "google":
-                doc += "Attributes:\n"
-                for attr in info["attributes"]:
-                    doc += f"    {attr}: Description.\n"
-            elif self.style == "numpy":
-                doc += "Attributes\n----------\n"
-                for attr in info["attributes"]:
-                    doc += f"{attr}\n    Description.\n"
-            else: # rest
-                for attr in info["attributes"]:
-                    doc += f":ivar {attr}: Description.\n"
-        doc += '"""'
-        return doc
-
-
-def extract_metadata(source_code):
-    """Extracts metadata for functions and classes using AST."""
-    tree = ast.parse(source_code)
-    nodes_info = []
-
-    # Module level docstring
-    # Find the maximum line number to cover the entire file
-    max_line = 1
-    for node in ast.walk(tree):
-        if hasattr(node, 'lineno'):
-            max_line = max(max_line, getattr(node, 'end_lineno', node.lineno))
-
-    nodes_info.append({
+            parts.append(self._attr_header)
+            parts.extend(self._attr_line.format(name=attr) for attr in info["attributes"])
+        parts.append(_DOC_END)
+        return "".join(parts)
+
+
+def _simple_annotation(node):
+    """Returns the source for common annotation shapes, or None for anything else."""
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Attribute:
+        if type(node.value) not in (ast.Name, ast.Attribute):
+            return None
+        value = _simple_annotation(node.value)
+        return f"{value}.{node.attr}" if value is not None else None
+    if node_type is ast.Constant:
+        value = node.value
+        if value is None or value is Ellipsis:
+            return "None" if value is None else "..."
+        if type(value) in (int, bool):
+            return repr(value)
+        # Strings ast.unparse would quote or escape differently are left to it
+        # (including u"..." literals, which it keeps the u prefix on)
+        if type(value) is str and node.kind is None and value.isprintable() and not any(c in value for c in "'\"\\"):
+            return f"'{value}'"
+        return None
+    if node_type is ast.Subscript:
+        if type(node.value) not in (ast.Name, ast.Attribute):
+            return None
+        value = _simple_annotation(node.value)
+        if type(node.slice) is ast.Tuple:
+            # A one-element tuple keeps its trailing comma; leave that to ast.unparse
+            if len(node.slice.elts) < 2:
+                return None
+            items = [_simple_annotation(elt) for elt in node.slice.elts]
+            inner = None if None in items else ", ".join(items)
+        else:
+            inner = _simple_annotation(node.slice)
+        if value is None or inner is None:
+            return None
+        return f"{value}[{inner}]"
+    return None
+
+
+def _quick_unparse(node):
+    """Unparses an annotation, skipping ast.unparse for the common simple shapes."""
+    text = _simple_annotation(node)
+    return text if text is not None else ast.unparse(node)
+
+
+def _has_docstring(node):
+    """Returns whether a module/class/function body starts with a docstring.
+
+    Same test as ``ast.get_docstring(node) is not None`` without cleaning the text.
+    """
+    body = node.body
+    return (
+        bool(body)
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+        and isinstance(body[0].value.value, str)
+    )
+
+
+def _raised_call_name(exc):
+    """Returns the exception name for ``raise Exc(...)``."""
+    if isinstance(exc.func, ast.Name):
+        return exc.func.id
+    elif isinstance(exc.func, ast.Attribute):
+        return exc.func.attr
+    return None
+
+
+def _raised_name(exc):
+    """Returns the exception name for ``raise Exc``."""
+    return exc.id
+
+
+# Exception-name extractors keyed by the type of the raised expression
+_RAISE_HANDLERS = {
+    ast.Call: _raised_call_name,
+    ast.Name: _raised_name,
+}
+
+
+class _MetadataVisitor(ast.NodeVisitor):
+    """Collects function/class metadata in a single pass over the AST."""
+
+    def __init__(self, source_code):
+        """Initializes the collected nodes and the enclosing-function stack."""
+        self.nodes_info = []
+        # Innermost function info on top; None marks a scope (module, class
+        # body, lambda) whose returns/yields/raises belong to no function
+        self.func_stack = [None]
+        # Universal-newline split so indices match the parser's line numbers
+        # (bytes.splitlines only splits on \n, \r and \r\n, unlike str's)
+        if isinstance(source_code, bytes):
+            self.source_lines = source_code.splitlines()
+        else:
+            self.source_lines = io.StringIO(source_code, newline=None).readlines()
+        self.annot_cache = {}
+
+    def _unparse(self, node):
+        """Unparses an annotation, reusing the result for identical source text."""
+        if node.lineno == node.end_lineno:
+            line = self.source_lines[node.lineno - 1]
+            # Offsets are in UTF-8 bytes of the decoded line, which match the
+            # raw text (str or bytes in any source encoding) only for ASCII
+            if line.isascii():
+                key = line[node.col_offset:node.end_col_offset]
+                text = self.annot_cache.get(key)
+                if text is None:
+                    text = self.annot_cache[key] = _quick_unparse(node)
+                return text
+        return _quick_unparse(node)
+
+    def visit_FunctionDef(self, node):
+        """Records function metadata and analyzes its body."""
+        info = {
+            "type": "function",
+            "name": node.name,
+            "lineno": node.lineno,
+            "end_lineno": getattr(node, 'end_lineno', node.lineno),
+            "params": [],
+            "return_type": None,
+            "returns": False,
+            "yields": False,
+            "raises": set(),
+            "has_docstring": _has_docstring(node)
+        }
+
+        # Params and type hints
+        for arg in node.args.args:
+            arg_name = arg.arg
+            if arg_name in ('self', 'cls'):
+                continue
+            type_hint = None
+            if arg.annotation:
+                type_hint = self._unparse(arg.annotation)
+            info["params"].append((arg_name, type_hint))
+
+        if node.returns:
+            info["return_type"] = self._unparse(node.returns)
+
+        self.nodes_info.append(info)
+
+        # Decorators, defaults and annotations are evaluated in the enclosing scope
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        self.visit(node.args)
+        if node.returns:
+            self.visit(node.returns)
+
+        # Returns/yields/raises in the body belong to this function
+        self.func_stack.append(info)
+        for stmt in node.body:
+            self.visit(stmt)
+        self.func_stack.pop()
+        # Sort once here so every generated style can iterate it directly
+        info["raises"] = tuple(sorted(info["raises"]))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        """Records class metadata and descends into its body."""
+        info = {
+            "type": "class",
+            "name": node.name,
+            "lineno": node.lineno,
+            "end_lineno": getattr(node, 'end_lineno', node.lineno),
+            "attributes": [],
+            "has_docstring": _has_docstring(node),
+        }
+        # Class attributes (simple detection)
+        for subnode in node.body:
+            if isinstance(subnode, ast.Assign):
+                for target in subnode.targets:
+                    if isinstance(target, ast.Name):
+                        info["attributes"].append(target.id)
+            elif isinstance(subnode, ast.AnnAssign):
+                if isinstance(subnode.target, ast.Name):
+                    info["attributes"].append(subnode.target.id)
+
+        self.nodes_info.append(info)
+
+        # Decorators, bases and keywords are evaluated in the enclosing scope
+        for child in (*node.decorator_list, *node.bases, *node.keywords):
+            self.visit(child)
+        self.func_stack.append(None)
+        for stmt in node.body:
+            self.visit(stmt)
+        self.func_stack.pop()
+
+    def visit_Lambda(self, node):
+        """Keeps yields inside a lambda from marking the enclosing function."""
+        # Default values are evaluated in the enclosing scope
+        self.visit(node.args)
+        self.func_stack.append(None)
+        self.visit(node.body)
+        self.func_stack.pop()
+
+    def visit_Return(self, node):
+        """Marks the enclosing function as returning a value."""
+        if node.value and self.func_stack[-1] is not None:
+            self.func_stack[-1]["returns"] = True
+        self.generic_visit(node)
+
+    def visit_Yield(self, node):
+        """Marks the enclosing function as a generator."""
+        if self.func_stack[-1] is not None:
+            self.func_stack[-1]["yields"] = True
+        self.generic_visit(node)
+
+    visit_YieldFrom = visit_Yield
+
+    def visit_Raise(self, node):
+        """Records the exception raised in the enclosing function."""
+        if node.exc and self.func_stack[-1] is not None:
+            handler = _RAISE_HANDLERS.get(type(node.exc))
+            name = handler(node.exc) if handler else None
+            if name is not None:
+                self.func_stack[-1]["raises"].add(name)
+        self.generic_visit(node)
+
+
+def extract_metadata(source_code, tree=None):
+    """Extracts metadata for functions and classes using AST.
+
+    ``source_code`` may be text or raw file bytes. ``tree`` may be passed when
+    it has already been parsed.
+    """
+    if tree is None:
+        tree = compile(source_code, "<unknown>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+    visitor = _MetadataVisitor(source_code)
+    visitor.visit(tree)
+
+    # Module level docstring, covering the entire file. ast.Module carries no
+    # position, so the module ends where its last top-level statement does.
+    max_line = getattr(tree, 'end_lineno', None) or (tree.body[-1].end_lineno if tree.body else 1)
+    module_info = {
         "type": "module",
         "name": "Module",
         "lineno": 1,
         "end_lineno": max_line,
-        "has_docstring": ast.get_docstring(tree) is not None
-    })
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            info = {
-                "type": "function",
-                "name": node.name,
-                "lineno": node.lineno,
-                "end_lineno": getattr(node, 'end_lineno', node.lineno),
-                "params": [],
-                "return_type": None,
-                "returns": False,
-                "yields": False,
-                "raises": set(),
-                "has_docstring": ast.get_docstring(node) is not None
-            }
-            
-            # Params and type hints
-            for arg in node.args.args:
-                arg_name = arg.arg
-                if arg_name in ('self', 'cls'):
-                    continue
-                type_hint = None
-                if arg.annotation:
-                    type_hint = ast.unparse(arg.annotation)
-                info["params"].append((arg_name, type_hint))
-            
-            if node.returns:
-                info["return_type"] = ast.unparse(node.returns)
-
-            # Analyze function body
-            for subnode in ast.walk(node):
-                if isinstance(subnode, ast.Return) and subnode.value:
-                    info["returns"] = True
-                if isinstance(subnode, (ast.Yield, ast.YieldFrom)):
-                    info["yields"] = True
-                if isinstance(subnode, ast.Raise):
-                    if subnode.exc:
-                        if isinstance(subnode.exc, ast.Call):
-                            if hasattr(subnode.exc.func, 'id'):
-                                info["raises"].add(subnode.exc.func.id)
-                            elif isinstance(subnode.exc.func, ast.Attribute):
-                                info["raises"].add(subnode.exc.func.attr)
-                        elif isinstance(subnode.exc, ast.Name):
-                            info["raises"].add(subnode.exc.id)
-
-            nodes_info.append(info)
-
-        elif isinstance(node, ast.ClassDef):
-            info = {
-                "type": "class",
-                "name": node.name,
-                "lineno": node.lineno,
-                "end_lineno": getattr(node, 'end_lineno', node.lineno),
-                "attributes": [],
-                "has_docstring": ast.get_docstring(node) is not None,
-            }
-            # Class attributes (simple detection)
-            for subnode in node.body:
-                if isinstance(subnode, ast.Assign):
-                    for target in subnode.targets:
-                        if isinstance(target, ast.Name):
-                            info["attributes"].append(target.id)
-                elif isinstance(subnode, ast.AnnAssign):
-                    if isinstance(subnode.target, ast.Name):
-                        info["attributes"].append(subnode.target.id)
-            
-            nodes_info.append(info)
+        "has_docstring": _has_docstring(tree)
+    }
 
-    return nodes_info
+    return [module_info] + visitor.nodes_info
 
 
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Loads configuration from pyproject.toml."""
+    """Loads configuration from pyproject.toml.
+
+    The result is cached for the life of the process, so Streamlit reruns do
+    not re-read the file. Callers must treat the returned dict as read-only.
+    """
     default_config = {
         "min_coverage": 80.0,
         "default_style": "google",
@@ -234,30 +416,150 @@ def load_config():
     return default_config
 
 
-def validate_docstrings(file_path, select=None, ignore=None):
-    """Validates docstrings using pydocstyle with selective rules."""
-    violations = []
-    try:
-        errors = list(check([file_path], select=select, ignore=ignore))
-        for error in errors:
-            violations.append({
-                "code": error.code,
-                "message": error.message,
-                "line": error.line,
-                "short_desc": error.short_desc
-            })
-    except Exception as e:
-        print(f"Validation error: {e}")
-    return violations
+# pydocstyle is imported inside the functions below so that runs without
+# validation don't pay for it.
+@functools.lru_cache(maxsize=None)
+def _select_codes(style):
+    """Returns the pydocstyle rules checked for a style (None means pydocstyle defaults)."""
+    if style not in ("google", "numpy"):
+        return None
+    from pydocstyle.violations import conventions
+    return frozenset(getattr(conventions, style))
 
 
-def run(file_path, style="google", validate=False):
-    """Main execution logic for Milestone-2."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        source_code = f.read()
-    
-    nodes = extract_metadata(source_code)
-    generator = DocstringGenerator(style=style)
+def _checked_codes(select, ignore):
+    """Mirrors how pydocstyle.check picks the error codes to report."""
+    from pydocstyle.violations import ErrorRegistry, conventions
+
+    if select is not None:
+        return select
+    if ignore is not None:
+        return set(ErrorRegistry.get_error_codes()) - set(ignore)
+    return conventions.pep257
+
+
+# pydocstyle parses through a shared module-level Parser, so concurrent checks
+# (e.g. Streamlit sessions on separate threads) must not interleave
+_PYDOCSTYLE_LOCK = threading.Lock()
+
+
+class _Unkeyed:
+    """Carries a value through an lru_cache call without making it part of the key."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 0
+
+    def __eq__(self, other):
+        return isinstance(other, _Unkeyed)
+
+
+def _check_docstrings(file_path, select, ignore, source_code):
+    """Runs pydocstyle on one file and returns its violations as a tuple of dicts."""
+    from pydocstyle import check
+    from pydocstyle.checker import ConventionChecker
+
+    # Errors (undecodable or unparsable source) propagate so callers can
+    # fail the check rather than mistake them for a clean file
+    if source_code is None:
+        with _PYDOCSTYLE_LOCK:
+            errors = list(check([file_path], select=select, ignore=ignore))
+    else:
+        if isinstance(source_code, bytes):
+            source_code = _decode_source(source_code)
+        codes = _checked_codes(select, ignore)
+        with _PYDOCSTYLE_LOCK:
+            errors = [
+                error for error in ConventionChecker().check_source(source_code, file_path)
+                if error.code in codes
+            ]
+    violations = []
+    for error in errors:
+        if isinstance(error, Exception):
+            # check() yields files it could not read or parse as exceptions
+            raise error
+        violations.append({
+            "code": error.code,
+            "message": error.message,
+            "line": error.line,
+            "short_desc": error.short_desc
+        })
+    return tuple(violations)
+
+
+# lru_cache is thread-safe, which matters under Streamlit's per-session threads
+@functools.lru_cache(maxsize=32)
+def _cached_check(source_digest, file_path, select, ignore, source):
+    """Memoizes _check_docstrings per (digest, path, select, ignore); ``source`` is not keyed."""
+    return _check_docstrings(file_path, select, ignore, source.value)
+
+
+def validate_docstrings(file_path, select=None, ignore=None, source_digest=None, source_code=None):
+    """Validates docstrings using pydocstyle with selective rules.
+
+    When ``source_code`` (text or raw bytes) is given it is checked directly
+    instead of re-reading ``file_path``, which then only names the module.
+    When ``source_digest`` is given, results are memoized per file contents
+    and rule selection so unchanged files are not checked again.
+    """
+    if source_digest is None:
+        return list(_check_docstrings(file_path, select, ignore, source_code))
+    return list(_cached_check(
+        source_digest,
+        file_path,
+        tuple(sorted(select)) if select is not None else None,
+        tuple(sorted(ignore)) if ignore is not None else None,
+        _Unkeyed(source_code),
+    ))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_generator(style):
+    """Returns a shared DocstringGenerator per style; it holds no per-file state."""
+    return DocstringGenerator(style=style)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(file_path, mtime_ns, size):
+    """Reads and parses a file once per (path, mtime, size) version.
+
+    The raw bytes are parsed directly, honouring any encoding cookie. compile()
+    is called without the ast.parse wrapper, and SyntaxErrors name the file.
+    """
+    with open(file_path, "rb") as f:
+        source_bytes = f.read()
+    tree = compile(source_bytes, file_path, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+    return source_bytes, tree
+
+
+def _decode_source(source_bytes):
+    """Decodes file bytes as tokenize.open() would (PEP 263 cookie or BOM, else UTF-8)."""
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(source_bytes).readline)
+    return io.TextIOWrapper(io.BytesIO(source_bytes), encoding=encoding).read()
+
+
+def run(file_path=None, style="google", validate=False, *, source=None):
+    """Main execution logic for Milestone-2.
+
+    Either ``file_path`` or the already-loaded ``source`` text must be given;
+    with ``source`` the file is not read from disk.
+    """
+    # source_code holds raw bytes when read from file_path; it is only decoded
+    # if validation needs the text
+    tree = None
+    if source is not None:
+        source_code = source
+    elif file_path is not None:
+        stat = os.stat(file_path)
+        source_code, tree = _parse_cached(file_path, stat.st_mtime_ns, stat.st_size)
+    else:
+        raise ValueError("run() requires either file_path or source")
+
+    nodes = extract_metadata(source_code, tree)
+    generator = _get_generator(style)
     
     generated_docs = []
     for node in nodes:
@@ -268,12 +570,21 @@ def run(file_path, style="google", validate=False):
                 "docstring": generator.generate(node)
             })
 
-    # Coverage metrics
-    total_funcs = sum(1 for n in nodes if n["type"] == "function")
-    total_classes = sum(1 for n in nodes if n["type"] == "class")
-    doc_funcs = sum(1 for n in nodes if n["type"] == "function" and n["has_docstring"])
-    doc_classes = sum(1 for n in nodes if n["type"] == "class" and n["has_docstring"])
-    has_mod_doc = any(n["type"] == "module" and n["has_docstring"] for n in nodes)
+    # Coverage metrics, gathered in a single pass over the nodes
+    total_funcs = total_classes = doc_funcs = doc_classes = 0
+    has_mod_doc = False
+    for n in nodes:
+        node_type = n["type"]
+        if node_type == "function":
+            total_funcs += 1
+            if n["has_docstring"]:
+                doc_funcs += 1
+        elif node_type == "class":
+            total_classes += 1
+            if n["has_docstring"]:
+                doc_classes += 1
+        elif node_type == "module" and n["has_docstring"]:
+            has_mod_doc = True
     
     total = total_funcs + total_classes + 1 # +1 for module
     documented = doc_funcs + doc_classes + (1 if has_mod_doc else 0)
@@ -290,29 +601,48 @@ def run(file_path, style="google", validate=False):
         "coverage_percentage": (documented / total * 100) if total > 0 else 100,
         "compliance": "PASS",
         "compliance_percentage": 100.0,
-        "violations": []
+        "violations": [],
+        "validation_error": None
     }
     
     if validate:
         # Pydocstyle conventions implementation
-        select_codes = None
-        if style == "google":
-            select_codes = list(conventions.google)
-        elif style == "numpy":
-            select_codes = list(conventions.numpy)
-        
-        violations = validate_docstrings(file_path, select=select_codes)
+        select_codes = _select_codes(style)
+
+        source_bytes = source_code if isinstance(source_code, bytes) else source_code.encode("utf-8")
+        source_digest = hashlib.blake2b(source_bytes).digest()
+        # Check the already-loaded source so the file is read only once
+        try:
+            violations = validate_docstrings(
+                file_path or "<string>",
+                select=select_codes,
+                source_digest=source_digest,
+                source_code=source_code,
+            )
+        except Exception as e:
+            # A file that could not be validated must not pass as compliant
+            violations = []
+            report["compliance"] = "FAIL"
+            report["compliance_percentage"] = 0.0
+            report["validation_error"] = f"{type(e).__name__}: {e}"
         report["violations"] = violations
         
         if violations:
             report["compliance"] = "FAIL"
-            # Calculate how many entities have violations
+            # Calculate how many entities have violations: bisect to the last
+            # entity starting at or before the violation line, stepping back
+            # out of nested entities that end before it.
+            sorted_nodes = sorted(nodes, key=lambda n: n["lineno"])
+            starts = [n["lineno"] for n in sorted_nodes]
             entities_with_violations = set()
             for v in violations:
-                for node in nodes:
-                    if node["lineno"] <= v["line"] <= node["end_lineno"]:
-                        entities_with_violations.add(node["name"])
-                        break
+                idx = bisect.bisect_right(starts, v["line"]) - 1
+                while idx > 0 and v["line"] > sorted_nodes[idx]["end_lineno"]:
+                    idx -= 1
+                if idx >= 0:
+                    # Keyed by position so same-named entities (e.g. two
+                    # __init__ methods) are counted separately
+                    entities_with_violations.add(idx)
             
             compliant_entities = total - len(entities_with_violations)
             report["compliance_percentage"] = (compliant_entities / total * 100) if total > 0 else 100.0
@@ -320,9 +650,19 @@ def run(file_path, style="google", validate=False):
     return generated_docs, report
 
 
+def _check_file(file_path, style, validate):
+    """Runs one CLI file, returning (docs, report, error) instead of raising."""
+    try:
+        docs, report = run(file_path, style=style, validate=validate)
+    except Exception as e:
+        # A bad file (syntax error, unreadable, ...) must not cost the others their reports
+        return None, None, f"{type(e).__name__}: {e}"
+    return docs, report, None
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Docstring Generator & Validator - Milestone 3")
-    parser.add_argument("file", help="Python file path")
+    parser.add_argument("files", nargs="+", metavar="file", help="Python file path(s)")
     parser.add_argument("--style", choices=["google", "numpy", "rest"], help="Docstring style (overrides config)")
     parser.add_argument("--validate", action="store_true", help="Run PEP 257 validation (overrides config)")
     parser.add_argument("--check-only", action="store_true", help="Exit with non-zero if requirements not met")
@@ -334,51 +674,96 @@ if __name__ == "__main__":
     validate = args.validate or config["validation_enabled"]
     min_cov = config["min_coverage"]
 
-    docs, report = run(args.file, style=style, validate=validate)
-
-    print("\n" + "="*40)
-    print(f"DOCSTRING TOOL RESULTS FOR: {args.file}")
-    print("="*40)
-
-    if not args.check_only:
-        print("\n--- Generated Docstrings ---")
-        if not docs:
-            print("Everything is already documented!")
-        else:
-            for d in docs:
-                print(f"\n[{d['type'].capitalize()}: {d['name']}]")
-                print(d['docstring'])
-
-    print("\n--- Docstring Coverage & Compliance Report ---")
-    print(f"Total Functions          : {report['total_functions']}")
-    print(f"Total Classes            : {report['total_classes']}")
-    print(f"Documented (Total)       : {report['with_doc']} / {report['total']}")
-    print(f"Coverage Percentage      : {report['coverage_percentage']:.2f}% (Threshold: {min_cov}%)")
-    print(f"PEP-257 Compliance       : {report['compliance']}")
-    print(f"Compliance Percentage    : {report['compliance_percentage']:.2f}%")
-    print(f"Total Violations         : {len(report['violations'])}")
-
-    if (args.validate or validate) and report['violations']:
-        print("\n--- Validation Errors (pydocstyle) ---")
-        for v in report['violations']:
-            print(f"Line {v['line']} [{v['code']}]: {v['message']}")
-
-    print("\n" + "="*40)
-
-    # CI/Hook checks
-    failed = False
-    if report['coverage_percentage'] < min_cov:
-        print(f"ERROR: Coverage {report['coverage_percentage']:.2f}% is below threshold {min_cov}%")
-        failed = True
+    # All files are checked in this one invocation, so interpreter startup and
+    # the pydocstyle import are paid once per batch rather than once per file.
+    # Files are independent, so a batch is analysed across worker processes;
+    # reports are still printed in the order given.
+    run_file = functools.partial(_check_file, style=style, validate=validate)
+    if len(args.files) > 1:
+        if validate:
+            # Imported before the pool starts so forked workers inherit it
+            # instead of each importing pydocstyle again
+            try:
+                import pydocstyle.checker  # noqa: F401
+            except ImportError:
+                pass  # each file then reports the ImportError as its own failure
+        workers = min(len(args.files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_file, f) for f in args.files]
+        results = []
+        for future in futures:
+            # _check_file already catches analysis errors; this covers a worker
+            # that died outright (BrokenProcessPool) so the rest still report
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append((None, None, f"{type(e).__name__}: {e}"))
+    else:
+        results = [run_file(args.files[0])]
+
+    any_failed = False
+    any_errored = False
+    for file_path, (docs, report, error) in zip(args.files, results):
+        # Each file's report is assembled in memory and written in one call
+        buf = io.StringIO()
+
+        print("\n" + "="*40, file=buf)
+        print(f"DOCSTRING TOOL RESULTS FOR: {file_path}", file=buf)
+        print("="*40, file=buf)
+
+        if error is not None:
+            print(f"ERROR: Could not analyse file: {error}", file=buf)
+            print("Status: FAILED", file=buf)
+            sys.stdout.write(buf.getvalue())
+            any_failed = any_errored = True
+            continue
+
+        if not args.check_only:
+            print("\n--- Generated Docstrings ---", file=buf)
+            if not docs:
+                print("Everything is already documented!", file=buf)
+            else:
+                for d in docs:
+                    print(f"\n[{d['type'].capitalize()}: {d['name']}]", file=buf)
+                    print(d['docstring'], file=buf)
+
+        print("\n--- Docstring Coverage & Compliance Report ---", file=buf)
+        print(f"Total Functions          : {report['total_functions']}", file=buf)
+        print(f"Total Classes            : {report['total_classes']}", file=buf)
+        print(f"Documented (Total)       : {report['with_doc']} / {report['total']}", file=buf)
+        print(f"Coverage Percentage      : {report['coverage_percentage']:.2f}% (Threshold: {min_cov}%)", file=buf)
+        print(f"PEP-257 Compliance       : {report['compliance']}", file=buf)
+        print(f"Compliance Percentage    : {report['compliance_percentage']:.2f}%", file=buf)
+        print(f"Total Violations         : {len(report['violations'])}", file=buf)
+        if report['validation_error']:
+            print(f"Validation error         : {report['validation_error']}", file=buf)
+
+        if (args.validate or validate) and report['violations']:
+            print("\n--- Validation Errors (pydocstyle) ---", file=buf)
+            for v in report['violations']:
+                print(f"Line {v['line']} [{v['code']}]: {v['message']}", file=buf)
+
+        print("\n" + "="*40, file=buf)
+
+        # CI/Hook checks
+        failed = False
+        if report['coverage_percentage'] < min_cov:
+            print(f"ERROR: Coverage {report['coverage_percentage']:.2f}% is below threshold {min_cov}%", file=buf)
+            failed = True
     
-    if validate and report['compliance'] == "FAIL":
-        print("ERROR: PEP-257 validation failed!")
-        failed = True
+        if validate and report['compliance'] == "FAIL":
+            print("ERROR: PEP-257 validation failed!", file=buf)
+            failed = True
     
-    if failed:
-        if args.check_only:
-            sys.exit(1)
+        if failed:
+            any_failed = True
+            if not args.check_only:
+                print("Status: FAILED (Commit would be blocked in pre-commit hook)", file=buf)
         else:
-            print("Status: FAILED (Commit would be blocked in pre-commit hook)")
-    else:
-        print("Status: PASSED")
+            print("Status: PASSED", file=buf)
+        sys.stdout.write(buf.getvalue())
+
+    # A file that could not be analysed always fails, as it did when the
+    # tool crashed on it; threshold failures only block with --check-only
+    if any_errored or (any_failed and args.check_only):
+        sys.exit(1)
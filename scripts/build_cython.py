@@ -0,0 +1,75 @@
+"""Optional build script that compiles main.py into a C extension with Cython."""
+import glob
+import os
+import subprocess
+import sys
+
+# Runs in a separate interpreter so a crashing extension can't take this script
+# down: the compiled module must load and match pure-Python main.py.
+SMOKE_TEST = """
+import importlib.util
+import main
+
+assert not main.__file__.endswith(".py"), "compiled extension was not loaded"
+spec = importlib.util.spec_from_file_location("main_py", "main.py")
+pure = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(pure)
+
+try:
+    import pydocstyle
+    validate = True
+except ImportError:
+    validate = False
+
+for path in ("main.py", "test_sample.py"):
+    for style in ("google", "numpy", "rest"):
+        assert main.run(path, style=style, validate=validate) == pure.run(path, style=style, validate=validate), (path, style)
+"""
+
+def built_extensions():
+    """Returns the in-place built main extension files."""
+    return glob.glob("main.*.so") + glob.glob("main.*.pyd")
+
+def build():
+    """Cythonizes main.py in place, falling back to pure Python when unavailable."""
+    if os.environ.get("PYDOC_CYTHON", "True").lower() in ("0", "false", "no"):
+        print("PYDOC_CYTHON is disabled; keeping the pure-Python main.py.")
+        return
+
+    try:
+        from Cython.Build import cythonize
+        from setuptools import setup
+    except ImportError:
+        print("Cython/setuptools not installed; keeping the pure-Python main.py.")
+        return
+
+    if not os.path.exists("main.py"):
+        print("Error: main.py not found. Are you in the root of the repository?")
+        sys.exit(1)
+
+    # main.py relies on negative indexing (e.g. stack[-1]), so Cython's
+    # default boundscheck/wraparound directives must stay enabled. Always
+    # rebuild so a stale main.c or object file is never reused.
+    try:
+        setup(
+            script_args=["build_ext", "--inplace", "--force"],
+            ext_modules=cythonize(["main.py"], language_level=3, force=True),
+        )
+    except (SystemExit, Exception) as e:
+        # Typically a missing C compiler
+        print(f"Warning: Cython build failed ({e}). Keeping the pure-Python main.py.")
+        return
+
+    result = subprocess.run([sys.executable, "-c", SMOKE_TEST])
+    if result.returncode != 0:
+        for path in built_extensions():
+            os.remove(path)
+        print(f"Error: smoke test of the built extension failed (exit {result.returncode}).")
+        print("Removed it; the pure-Python main.py stays in use.")
+        sys.exit(1)
+
+    print("Built and smoke-tested main extension. `import main` now loads it ahead of main.py;")
+    print("re-run this script after editing main.py, or delete the built .so/.pyd.")
+
+if __name__ == "__main__":
+    build()
@@ -20,13 +20,9 @@ def main():
 
     print(f"Checking {len(staged_files)} staged files for docstrings...")
     
-    failed = False
-    for file in staged_files:
-        print(f"\n>> Checking {file}")
-        # Run main.py with --check-only flag
-        result = subprocess.run([sys.executable, "main.py", file, "--check-only"])
-        if result.returncode != 0:
-            failed = True
+    # Run main.py once over all staged files with --check-only flag
+    result = subprocess.run([sys.executable, "main.py", *staged_files, "--check-only"])
+    failed = result.returncode != 0
 
     if failed:
         print("\n\033[91mCOMMIT BLOCKED: Docstring requirements not met.\033[0m")